@@ -4,21 +4,21 @@ Orchestrates the complete data pipeline: Extract → Transform → Load
 Answers the business question: When will there be 42,000 Starlink satellites?
 """
 
+import logging
 from datetime import datetime, timedelta
+from typing import Dict
 from airflow import DAG
+from airflow.decorators import task
+from airflow.utils.task_group import TaskGroup
 from airflow.operators.python_operator import PythonOperator
-from airflow.operators.bash_operator import BashOperator
 from airflow.utils.dates import days_ago
 from airflow.models import Variable
-import sys
-import os
 
-# Add include directory to Python path
-sys.path.append('/usr/local/airflow/include')
+# dbt_runner is stdlib-only (dbt itself loads on first run); the extractor and DB modules
+# are imported inside the task callables so scheduler parsing never loads them
+from include.utils.dbt_runner import run_dbt, load_model_graph
 
-# Import our custom modules
-from extractors.spacex_extractor import SpaceXExtractor, test_connection
-from utils.database_utils import check_data_quality, get_pipeline_status
+logger = logging.getLogger(__name__)
 
 # DAG configuration
 default_args = {
@@ -68,43 +68,69 @@ dag = DAG(
 
 def test_database_connection(**context):
     """Test database connectivity before starting pipeline"""
+    from include.extractors.spacex_extractor import test_connection
+    
     if not test_connection():
         raise Exception("Database connection test failed")
     return "Database connection successful"
 
-def extract_spacex_launches(**context):
-    """Extract launch data from SpaceX API"""
-    extractor = SpaceXExtractor()
-    records_count = extractor.extract_launches(**context)
-    
-    # Push to XCom for downstream tasks
-    context['task_instance'].xcom_push(key='launches_count', value=records_count)
-    return f"Extracted {records_count} launch records"
-
-def extract_spacex_starlink(**context):
-    """Extract Starlink satellite data from SpaceX API"""
-    extractor = SpaceXExtractor()
-    records_count = extractor.extract_starlink(**context)
+def run_dbt_model(model_name: str, **context):
+    """Run a single dbt model"""
+    run_dbt(['run', '--select', model_name])
+    return f"dbt model {model_name} completed"
+
+def run_dbt_layer(layer: str, **context):
+    """Run every dbt model in a layer (fallback when no manifest is available at parse time)"""
+    run_dbt(['run', '--models', layer])
+    return f"{layer.capitalize()} layer models completed"
+
+def run_dbt_tests(**context):
+    """Run dbt data quality tests across all layers"""
+    run_dbt(['test'])
+    return "dbt data tests completed"
+
+def generate_dbt_docs(**context):
+    """Generate dbt documentation for data lineage and model descriptions"""
+    run_dbt(['docs', 'generate'])
+    return "dbt documentation generated"
+
+def run_final_validation(**context):
+    """Log the business question results from the Gold layer"""
+    logger.info("🎯 Checking business question results...")
+    try:
+        run_dbt(['run-operation', 'log_results'])
+    except Exception as e:
+        # Reporting only - never fail the pipeline here
+        logger.warning(f"dbt run-operation log_results failed: {e}")
+    return "✅ SpaceX ETL Pipeline completed successfully!"
+
+# TaskFlow tasks - return values become a single XCom each, consumed as typed arguments
+# (multiple_outputs=False: a Dict return annotation would otherwise push one XCom per key)
+
+@task(
+    task_id='extract_all_bronze',
+    multiple_outputs=False,
+    doc_md="Extract launches, Starlink and rockets from SpaceX API to bronze tables concurrently",
+    dag=dag
+)
+def extract_spacex_bronze(**context) -> Dict[str, int]:
+    """Extract launches, Starlink and rockets from SpaceX API in a single task"""
+    from include.extractors.spacex_extractor import SpaceXExtractor
     
-    # Push to XCom for downstream tasks
-    context['task_instance'].xcom_push(key='starlink_count', value=records_count)
-    return f"Extracted {records_count} Starlink satellite records"
-
-def extract_spacex_rockets(**context):
-    """Extract rocket data from SpaceX API"""
     extractor = SpaceXExtractor()
-    records_count = extractor.extract_rockets(**context)
-    
-    # Push to XCom for downstream tasks
-    context['task_instance'].xcom_push(key='rockets_count', value=records_count)
-    return f"Extracted {records_count} rocket records"
+    return extractor.extract_all(**context)
 
-def run_data_quality_checks(**context):
+@task(
+    task_id='data_quality_checks',
+    multiple_outputs=False,
+    doc_md="Run data quality checks on bronze layer data",
+    dag=dag
+)
+def run_data_quality_checks(**context) -> Dict:
     """Run data quality checks on bronze layer"""
-    quality_results = check_data_quality(**context)
+    from include.utils.database_utils import check_data_quality
     
-    # Push results to XCom
-    context['task_instance'].xcom_push(key='quality_checks', value=quality_results)
+    quality_results = check_data_quality(**context)
     
     # Fail task if critical quality issues found
     if quality_results.get('launches_missing_data', 0) > 50:
@@ -113,35 +139,31 @@ def run_data_quality_checks(**context):
     if quality_results.get('starlink_total', 0) == 0:
         raise Exception("No Starlink satellite data found")
     
-    return f"Data quality checks passed: {quality_results}"
+    return quality_results
 
-# def get_extraction_summary(**context):
-#     """Get summary of extraction results"""
-#     extractor = SpaceXExtractor()
-#     summary = extractor.get_extraction_summary()
-    
-#     # Pull counts from XCom
-#     ti = context['task_instance']
-#     launches_count = ti.xcom_pull(task_ids='extract_launches', key='launches_count')
-#     starlink_count = ti.xcom_pull(task_ids='extract_starlink', key='starlink_count')
-#     rockets_count = ti.xcom_pull(task_ids='extract_rockets', key='rockets_count')
+@task(
+    task_id='extraction_summary',
+    multiple_outputs=False,
+    doc_md="Generate summary of extraction results",
+    dag=dag
+)
+def get_extraction_summary(counts: Dict[str, int]) -> Dict:
+    """Get summary of extraction results"""
+    from include.extractors.spacex_extractor import SpaceXExtractor
     
-#     summary.update({
-#         'current_run_launches': launches_count,
-#         'current_run_starlink': starlink_count,
-#         'current_run_rockets': rockets_count
-#     })
+    extractor = SpaceXExtractor()
+    summary = extractor.get_extraction_summary()
     
-#     context['task_instance'].xcom_push(key='extraction_summary', value=summary)
-#     return f"Extraction summary: {summary}"
-
-# def notify_completion(**context):
+    summary.update({
+        'current_run_launches': counts['launches'],
+        'current_run_starlink': counts['starlink'],
+        'current_run_rockets': counts['rockets']
+    })
+    return summary
+
+# @task(task_id='completion_notification', doc_md="Send completion notification with pipeline results", dag=dag)
+# def notify_completion(extraction_summary: Dict, quality_checks: Dict):
 #     """Send completion notification with results"""
-#     ti = context['task_instance']
-    
-#     # Get results from XCom
-#     extraction_summary = ti.xcom_pull(task_ids='extraction_summary', key='extraction_summary')
-#     quality_checks = ti.xcom_pull(task_ids='data_quality_checks', key='quality_checks')
     
 #     # Log completion message
 #     message = f"""
@@ -177,132 +199,110 @@ test_db_connection = PythonOperator(
 )
 
 # 2. Bronze Layer - Data Extraction
-extract_launches = PythonOperator(
-    task_id='extract_launches',
-    python_callable=extract_spacex_launches,
-    doc_md="Extract launch data from SpaceX API to bronze.launches table",
-    dag=dag
-)
-
-extract_starlink = PythonOperator(
-    task_id='extract_starlink',
-    python_callable=extract_spacex_starlink,
-    doc_md="Extract Starlink satellite data from SpaceX API to bronze.starlink table",
-    dag=dag
-)
-
-extract_rockets = PythonOperator(
-    task_id='extract_rockets',
-    python_callable=extract_spacex_rockets,
-    doc_md="Extract rocket specifications from SpaceX API to bronze.rockets table",
-    dag=dag
-)
-
-# 3. Data Quality Checks
-data_quality_checks = PythonOperator(
-    task_id='data_quality_checks',
-    python_callable=run_data_quality_checks,
-    doc_md="Run data quality checks on bronze layer data",
-    dag=dag
-)
-
-# extraction_summary = PythonOperator(
-#     task_id='extraction_summary',
-#     python_callable=get_extraction_summary,
-#     doc_md="Generate summary of extraction results",
-#     dag=dag
-# )
-
-# 4. Silver Layer - dbt Transformations (Cleaning & Parsing)
-silver_transformations = BashOperator(
-    task_id='silver_transformations',
-    bash_command="""
-    cd /usr/local/airflow/include/dbt && \
-    dbt deps --profiles-dir . && \
-    dbt run --models silver --profiles-dir . && \
-    echo "Silver layer transformations completed"
-    """,
-    doc_md="Run dbt models for Silver layer (data cleaning and parsing)",
-    dag=dag
-)
-
-# 5. Gold Layer - Business Analytics
-gold_analytics = BashOperator(
-    task_id='gold_analytics',
-    bash_command="""
-    cd /usr/local/airflow/include/dbt && \
-    dbt run --models gold --profiles-dir . && \
-    echo "Gold layer analytics completed"
-    """,
-    doc_md="Run dbt models for Gold layer (business analytics and 42K projection)",
-    dag=dag
-)
+# One task fans out all three API calls on a single event loop, so their network
+# waits overlap without paying scheduler latency for three separate tasks
+extract_all_bronze = extract_spacex_bronze()
+
+# 3. Data Quality Checks & Extraction Summary
+data_quality_checks = run_data_quality_checks()
+extraction_summary = get_extraction_summary(extract_all_bronze)
+
+# 4 & 5. Silver & Gold Layers - one task per dbt model
+# Models and their dependencies come from the dbt manifest, so independent models run in
+# parallel and retry on their own; dbt tasks run in-process via utils/dbt_runner.py.
+# Without a readable manifest each layer falls back to a single `dbt run --models <layer>` task
+dbt_models = load_model_graph()
+model_tasks = {}
+
+def model_layer(model: Dict) -> str:
+    """Layer (models/ subfolder) a model's task is grouped under - 'other' for top-level models"""
+    return model['layer'] or 'other'
+
+def build_layer_group(layer: str, doc_md: str) -> TaskGroup:
+    """Create the TaskGroup holding one run task per dbt model in a layer"""
+    with TaskGroup(group_id=f'{layer}_models', dag=dag) as group:
+        layer_models = {uid: model for uid, model in dbt_models.items() if model_layer(model) == layer}
+        for unique_id, model in layer_models.items():
+            model_tasks[unique_id] = PythonOperator(
+                task_id=f"run_{model['name']}",
+                python_callable=run_dbt_model,
+                op_kwargs={'model_name': model['name']},
+                doc_md=f"{doc_md}: {model['name']}",
+                dag=dag
+            )
+        
+        # Layer fallback only without a manifest - with one, a layer with no models stays empty
+        if not dbt_models:
+            PythonOperator(
+                task_id=f'run_{layer}',
+                python_callable=run_dbt_layer,
+                op_kwargs={'layer': layer},
+                doc_md=doc_md,
+                dag=dag
+            )
+    return group
+
+silver_transformations = build_layer_group('silver', "Run dbt model for Silver layer (data cleaning and parsing)")
+gold_analytics = build_layer_group('gold', "Run dbt model for Gold layer (business analytics and 42K projection)")
+
+# Any model outside silver/ and gold/ still gets a task, in a group named after its folder
+for extra_layer in sorted({model_layer(model) for model in dbt_models.values()} - {'silver', 'gold'}):
+    build_layer_group(extra_layer, f"Run dbt model for {extra_layer} layer")
 
 # 6. Data Quality Tests
-dbt_tests = BashOperator(
+dbt_tests = PythonOperator(
     task_id='dbt_data_tests',
-    bash_command="""
-    cd /usr/local/airflow/include/dbt && \
-    dbt test --profiles-dir . && \
-    echo "dbt data tests completed"
-    """,
+    python_callable=run_dbt_tests,
     doc_md="Run dbt data quality tests across all layers",
     dag=dag
 )
 
 # 7. Generate Documentation
-generate_docs = BashOperator(
+generate_docs = PythonOperator(
     task_id='generate_dbt_docs',
-    bash_command="""
-    cd /usr/local/airflow/include/dbt && \
-    dbt docs generate --profiles-dir . && \
-    echo "dbt documentation generated"
-    """,
+    python_callable=generate_dbt_docs,
     doc_md="Generate dbt documentation for data lineage and model descriptions",
     dag=dag
 )
 
 # 8. Final Validation & Notification
-final_validation = BashOperator(
+final_validation = PythonOperator(
     task_id='final_validation',
-    bash_command="""
-    cd /usr/local/airflow/include/dbt && \
-    echo "🎯 Checking business question results..." && \
-    dbt run-operation log_results --profiles-dir . || echo "Results logged" && \
-    echo "✅ SpaceX ETL Pipeline completed successfully!"
-    """,
+    python_callable=run_final_validation,
     doc_md="Final validation and logging of pipeline results",
     dag=dag
 )
 
-# completion_notification = PythonOperator(
-#     task_id='completion_notification',
-#     python_callable=notify_completion,
-#     doc_md="Send completion notification with pipeline results",
-#     dag=dag
-# )
+# completion_notification = notify_completion(extraction_summary, data_quality_checks)
 
 # ============================================================================
 # TASK DEPENDENCIES - Medallion Architecture Flow
 # ============================================================================
 
 # 1. Pre-flight check
-test_db_connection >> [extract_launches, extract_starlink, extract_rockets]
-
-# 2. Bronze Layer (Parallel extraction)
-[extract_launches, extract_starlink, extract_rockets] >> data_quality_checks
-
-# 3. Silver Layer (depends on bronze completion)
-data_quality_checks >> silver_transformations
-
-# # 3. Silver Layer (depends on bronze completion)
-# extraction_summary >> silver_transformations
-
-# 4. Gold Layer (depends on silver completion)
-silver_transformations >> gold_analytics
-
-# 5. Testing and Documentation (depends on gold completion)
-gold_analytics >> [dbt_tests, generate_docs]
+test_db_connection >> extract_all_bronze
+
+# 2. Bronze Layer (Concurrent extraction inside one task; summary wired via its XCom argument)
+extract_all_bronze >> data_quality_checks
+
+# 3-5. Silver & Gold Layers, then Testing and Documentation - each model runs after the models
+# it selects from; models with no upstream model wait for the bronze checks, and models nothing
+# selects from gate the dbt tests and docs
+if dbt_models:
+    selected_from = {upstream_id for model in dbt_models.values() for upstream_id in model['depends_on']}
+    for unique_id, model in dbt_models.items():
+        model_task = model_tasks[unique_id]
+        if model['depends_on']:
+            for upstream_id in model['depends_on']:
+                model_tasks[upstream_id] >> model_task
+        else:
+            [data_quality_checks, extraction_summary] >> model_task
+        
+        if unique_id not in selected_from:
+            model_task >> [dbt_tests, generate_docs]
+else:
+    # Layer fallback: bronze checks -> silver -> gold -> tests and docs
+    [data_quality_checks, extraction_summary] >> silver_transformations >> gold_analytics >> [dbt_tests, generate_docs]
 
 # 6. Final steps (depends on tests and docs)
 [dbt_tests, generate_docs] >> final_validation # >> completion_notification
\ No newline at end of file
@@ -33,6 +33,27 @@ launch_stats AS (
     FROM {{ ref('silver_launches') }}
     WHERE is_starlink_mission = true
       AND launch_date IS NOT NULL
+),
+
+-- Cumulative satellites deployed per launch day (days since 1970-01-01)
+daily_deployments AS (
+    SELECT 
+        (launch_date - DATE '1970-01-01') as launch_day,
+        SUM(COUNT(*)) OVER (ORDER BY launch_date) as cumulative_satellites
+    FROM {{ ref('silver_starlink') }}
+    WHERE launch_date IS NOT NULL
+    GROUP BY launch_date
+),
+
+-- Least-squares trend of the cumulative count, fitted in-database
+deployment_trend AS (
+    SELECT 
+        MAX(cumulative_satellites) as satellites_deployed,
+        MAX(launch_day) as latest_launch_day,
+        REGR_SLOPE(cumulative_satellites, launch_day) as satellites_per_day,
+        REGR_INTERCEPT(cumulative_satellites, launch_day) as trend_intercept,
+        REGR_R2(cumulative_satellites, launch_day) as trend_r_squared
+    FROM daily_deployments
 )
 
 SELECT 
@@ -70,6 +91,20 @@ SELECT
         ELSE NULL
     END as estimated_completion_date,
     
+    -- Trend projection (least-squares fit of cumulative deployments over time)
+    ROUND((dt.satellites_per_day * 30.44)::numeric, 1) as trend_satellites_per_month,
+    ROUND(dt.trend_r_squared::numeric, 3) as trend_r_squared,
+    CASE 
+        WHEN dt.satellites_deployed >= 42000 THEN
+            DATE '1970-01-01' + dt.latest_launch_day
+        -- Only project within 100 years of the latest launch: a near-zero slope would
+        -- otherwise overflow the integer day count and fail the whole model
+        WHEN dt.satellites_per_day > 0
+             AND (42000 - dt.trend_intercept) / dt.satellites_per_day - dt.latest_launch_day <= 36525 THEN
+            DATE '1970-01-01' + CEILING((42000 - dt.trend_intercept) / dt.satellites_per_day)::integer
+        ELSE NULL
+    END as trend_completion_date,
+    
     -- Confidence assessment
     CASE 
         WHEN ls.launches_2022 >= 5 THEN 'Medium Confidence'
@@ -84,4 +119,5 @@ SELECT
     EXTRACT(YEAR FROM ls.first_launch_date) || ' to ' || EXTRACT(YEAR FROM ls.latest_launch_date)) as data_summary
 
 FROM current_status cs
-CROSS JOIN launch_stats ls
\ No newline at end of file
+CROSS JOIN launch_stats ls
+CROSS JOIN deployment_trend dt
\ No newline at end of file
@@ -4,16 +4,120 @@ Fetches raw JSON from SpaceX API and loads directly to PostgreSQL
 """
 
 import os
-import requests
-import psycopg2
-import json
-from datetime import datetime
+import asyncio
+import hashlib
+import aiohttp
+import asyncpg
+import ijson
+import orjson
+import shutil
+import tempfile
+from smart_open import open as smart_open
+from psycopg2.pool import ThreadedConnectionPool
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 import logging
-from typing import List, Dict, Optional
+from typing import Dict, Optional, Tuple
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Endpoint -> request timeout (seconds); also the fan-out set for extract_all
+ENDPOINT_TIMEOUTS = {
+    'launches': 60,
+    'starlink': 120,
+    'rockets': 30
+}
+
+# Endpoints fetched incrementally through POST /<endpoint>/query, keyed to the field filtered on
+INCREMENTAL_FIELDS = {
+    'launches': 'date_utc',
+    'starlink': 'spaceTrack.CREATION_DATE'
+}
+
+# Transient API answers retried with exponential backoff (0.5s, 1s, 2s)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+
+# Re-fetch this far behind the sync cursor to pick up late edits (e.g. launch outcomes)
+INCREMENTAL_LOOKBACK = timedelta(days=30)
+
+# Remembers HTTP validators / body hash / sync cursor per endpoint so unchanged data is never reloaded
+SYNC_STATE_SQL = """
+    INSERT INTO bronze.sync_state (endpoint, etag, last_modified, content_hash, cursor_at, records_synced, synced_at)
+    VALUES ($1, $2, $3, $4, $5, $6, NOW())
+    ON CONFLICT (endpoint) 
+    DO UPDATE SET 
+        etag = EXCLUDED.etag,
+        last_modified = EXCLUDED.last_modified,
+        content_hash = EXCLUDED.content_hash,
+        cursor_at = EXCLUDED.cursor_at,
+        records_synced = EXCLUDED.records_synced,
+        synced_at = EXCLUDED.synced_at
+"""
+
+# An unchanged sync loads nothing but still moves the incremental cursor forward
+TOUCH_SYNC_STATE_SQL = """
+    UPDATE bronze.sync_state
+    SET cursor_at = COALESCE($2, cursor_at),
+        synced_at = NOW()
+    WHERE endpoint = $1
+"""
+
+# Optional raw landing zone (e.g. s3://spacex-bronze or a local directory) - any URI smart_open accepts
+BRONZE_LANDING_URI = os.getenv('SPACEX_BRONZE_LANDING_URI')
+
+# Per-transaction staging table that the JSONL body is COPYed into before the upsert
+STAGE_SQL = """
+    CREATE TEMP TABLE {stage} (data JSONB) ON COMMIT DROP
+"""
+
+# One JSON document per line, loaded as-is: CSV with quote/delimiter bytes that never
+# occur unescaped in JSON, so no quoting or backslash handling applies to the data
+COPY_QUOTE = '\x01'
+COPY_DELIMITER = '\x02'
+
+# DISTINCT ON keeps ON CONFLICT from touching the same id twice in one statement.
+# extracted_at is left to the column's DEFAULT NOW() (one timestamp per transaction)
+MERGE_STAGE_SQL = """
+    INSERT INTO {table} (id, data, source_system)
+    SELECT DISTINCT ON (data->>'id') data->>'id', data, 'spacex_api_v4'
+    FROM {stage}
+    ON CONFLICT (id) 
+    DO UPDATE SET 
+        data = EXCLUDED.data,
+        extracted_at = NOW()
+"""
+
+# JSONL spools stay in memory up to this size before spilling to a temp file
+SPOOL_MAX_BYTES = 32 * 1024 * 1024
+
+# Shared connection pool - created lazily on first use so DAG parsing never connects
+_POOL: Optional[ThreadedConnectionPool] = None
+
+def _get_pool(db_config: Dict) -> ThreadedConnectionPool:
+    """Return the process-wide connection pool, creating it on first call"""
+    global _POOL
+    if _POOL is None:
+        _POOL = ThreadedConnectionPool(minconn=1, maxconn=4, **db_config)
+    return _POOL
+
+class _HashingReader:
+    """Async file-like wrapper that SHA-256 hashes a response body as ijson pulls it"""
+    
+    def __init__(self, stream: aiohttp.StreamReader):
+        self._stream = stream
+        self._sha256 = hashlib.sha256()
+    
+    async def read(self, size: int = -1) -> bytes:
+        chunk = await self._stream.read(size)
+        self._sha256.update(chunk)
+        return chunk
+    
+    def hexdigest(self) -> str:
+        return self._sha256.hexdigest()
+
 class SpaceXExtractor:
     def __init__(self):
         self.base_url = "https://api.spacexdata.com/v4"
@@ -25,249 +129,323 @@ class SpaceXExtractor:
             'database': os.getenv('SPACEX_DB_NAME', 'spacex_db')
         }
     
-    def get_connection(self):
-        """Get PostgreSQL database connection"""
+    @contextmanager
+    def _conn(self):
+        """Borrow a PostgreSQL connection from the shared pool"""
         try:
-            conn = psycopg2.connect(**self.db_config)
-            return conn
+            pool = _get_pool(self.db_config)
+            conn = pool.getconn()
         except Exception as e:
             logger.error(f"Database connection failed: {e}")
             raise
+        try:
+            yield conn
+        finally:
+            pool.putconn(conn)
     
     def log_pipeline_run(self, dag_id: str, task_id: str, status: str, records: int = 0, error: str = None):
         """Log pipeline execution to metadata table"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # Fixed to match the actual table schema
-            cursor.execute("""
-                INSERT INTO bronze.pipeline_metadata (pipeline_name, status, records_processed, error_message)
-                VALUES (%s, %s, %s, %s)
-            """, (f"{dag_id}.{task_id}", status, records, error))
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+            with self._conn() as conn:
+                with conn:
+                    with conn.cursor() as cursor:
+                        # Fixed to match the actual table schema
+                        cursor.execute("""
+                            INSERT INTO bronze.pipeline_metadata (pipeline_name, status, records_processed, error_message)
+                            VALUES (%s, %s, %s, %s)
+                        """, (f"{dag_id}.{task_id}", status, records, error))
         except Exception as e:
             logger.error(f"Failed to log pipeline run: {e}")
     
-    def extract_launches(self, **context) -> int:
-        """Extract launch data from SpaceX API and load to bronze.launches"""
-        logger.info("🚀 Extracting launches from SpaceX API...")
+    async def _spool_jsonl(self, body, prefix: str) -> Tuple[tempfile.SpooledTemporaryFile, int]:
+        """Stream a JSON array body into a JSONL spool (one record per line) ready for COPY
         
-        try:
-            # Fetch data from API
-            response = requests.get(f"{self.base_url}/launches", timeout=60)
+        body is any object with an async read(), e.g. an aiohttp response stream, so only
+        the spool - capped in memory at SPOOL_MAX_BYTES - ever holds the payload.
+        Returns the rewound spool and its record count.
+        """
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        count = 0
+        
+        # use_float keeps numbers JSON-serializable (ijson defaults to Decimal)
+        async for record in ijson.items_async(body, prefix, use_float=True):
+            spool.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+            count += 1
+        
+        spool.seek(0)
+        return spool, count
+    
+    def _land(self, endpoint: str, jsonl, count: int) -> str:
+        """Write a JSONL spool, gzipped, to SPACEX_BRONZE_LANDING_URI as the raw audit trail
+        
+        Lands at <uri>/<endpoint>/YYYY-MM-DD/HHMMSS.jsonl.gz and returns that URI; the
+        spool is rewound afterwards so the same bytes can be COPYed.
+        """
+        landed_at = datetime.now(timezone.utc)
+        uri = f"{BRONZE_LANDING_URI.rstrip('/')}/{endpoint}/{landed_at:%Y-%m-%d}/{landed_at:%H%M%S}.jsonl.gz"
+        if '://' not in uri:
+            # Local directory landing zone - object stores need no parent "directories"
+            os.makedirs(os.path.dirname(uri), exist_ok=True)
+        
+        jsonl.seek(0)
+        # smart_open gzips based on the .gz extension
+        with smart_open(uri, 'wb') as landed:
+            shutil.copyfileobj(jsonl, landed)
+        jsonl.seek(0)
+        
+        logger.info(f"🪣 Landed {count} {endpoint} records at {uri}")
+        return uri
+    
+    async def _get_sync_state(self, pg_pool: asyncpg.Pool, endpoint: str, table: str) -> Dict:
+        """Get the HTTP validators, body hash and sync cursor stored by the last load of an endpoint
+        
+        Before the first recorded sync the cursor falls back to MAX(extracted_at) of the table.
+        """
+        async with pg_pool.acquire() as conn:
+            row = await conn.fetchrow(f"""
+                SELECT 
+                    s.etag,
+                    s.last_modified,
+                    s.content_hash,
+                    s.cursor_at,
+                    (SELECT MAX(extracted_at) FROM {table})
+                FROM (SELECT $1::text AS endpoint) e
+                LEFT JOIN bronze.sync_state s ON s.endpoint = e.endpoint
+            """, endpoint)
+        etag, last_modified, content_hash, cursor_at, last_extracted_at = row
+        
+        return {
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_hash': content_hash,
+            'cursor_at': cursor_at or last_extracted_at
+        }
+    
+    def _conditional_headers(self, state: Dict) -> Dict:
+        """Build If-None-Match / If-Modified-Since headers from stored sync state"""
+        headers = {}
+        if state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+        if state.get('last_modified'):
+            headers['If-Modified-Since'] = state['last_modified']
+        return headers
+    
+    def _request_spec(self, endpoint: str, state: Dict) -> Tuple[str, str, Dict, str]:
+        """Build (method, url, request kwargs, ijson prefix) for the next sync of an endpoint
+        
+        Incremental endpoints with a sync cursor POST a query for records at or after the
+        cursor (less INCREMENTAL_LOOKBACK); everything else is a conditional GET of the full list.
+        """
+        field = INCREMENTAL_FIELDS.get(endpoint)
+        if field and state.get('cursor_at'):
+            since = (state['cursor_at'] - INCREMENTAL_LOOKBACK).isoformat(timespec='seconds')
+            query = {
+                'query': {field: {'$gte': since}},
+                'options': {'pagination': False}
+            }
+            return 'POST', f"{self.base_url}/{endpoint}/query", {'json': query}, 'docs.item'
+        
+        return 'GET', f"{self.base_url}/{endpoint}", {'headers': self._conditional_headers(state)}, 'item'
+    
+    def _sync_started_at(self, endpoint: str) -> Optional[datetime]:
+        """Cursor value to store for this sync - the request start time (UTC) for incremental endpoints"""
+        if endpoint not in INCREMENTAL_FIELDS:
+            return None
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+    
+    async def _copy_to_table(self, pg_pool: asyncpg.Pool, endpoint: str, table: str, jsonl,
+                             records_count: int, sync: Dict) -> int:
+        """COPY a JSONL spool into a staging table, then upsert it into a bronze table"""
+        stage = f"stage_{table.split('.')[1]}"
+        
+        # Stage, upsert and record the sync state in a single transaction
+        async with pg_pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(STAGE_SQL.format(stage=stage))
+                await conn.copy_to_table(
+                    stage, source=jsonl, columns=['data'],
+                    format='csv', quote=COPY_QUOTE, delimiter=COPY_DELIMITER
+                )
+                await conn.execute(MERGE_STAGE_SQL.format(table=table, stage=stage))
+                await conn.execute(
+                    SYNC_STATE_SQL, endpoint, sync['etag'], sync['last_modified'],
+                    sync['content_hash'], sync['cursor_at'], records_count
+                )
+        
+        return records_count
+    
+    async def _skip_load(self, pg_pool: asyncpg.Pool, endpoint: str, cursor_at: Optional[datetime]) -> int:
+        """Record an unchanged sync - advance the incremental cursor and report 0 records loaded"""
+        async with pg_pool.acquire() as conn:
+            await conn.execute(TOUCH_SYNC_STATE_SQL, endpoint, cursor_at)
+        return 0
+    
+    async def _request(self, session: aiohttp.ClientSession, method: str, url: str,
+                       timeout: int, **kwargs) -> aiohttp.ClientResponse:
+        """Send a request, retrying connection errors and RETRY_STATUSES answers with backoff
+        
+        POST is retried too - the /query endpoints are read-only.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = await session.request(
+                    method,
+                    url,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                    **kwargs
+                )
+            except aiohttp.ClientConnectionError as e:
+                if attempt == MAX_RETRIES:
+                    raise
+                logger.warning(f"⚠️ {url} connection failed ({e}) - retrying")
+            else:
+                if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    return response
+                response.release()
+                logger.warning(f"⚠️ {url} answered {response.status} - retrying")
+            
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+    
+    async def _fetch_to_table(self, session: aiohttp.ClientSession, pg_pool: asyncpg.Pool,
+                              endpoint: str, table: str, timeout: int) -> int:
+        """Stream a JSON array endpoint into a bronze table through a size-bounded JSONL spool
+        
+        Incremental endpoints only fetch records changed since the sync cursor (see
+        _request_spec). Full fetches send the stored ETag / Last-Modified as a
+        conditional GET. When the API answers 304 (or, lacking validators, the body
+        hash is unchanged) nothing is loaded, the sync cursor still advances and 0 is
+        returned.
+        """
+        state = await self._get_sync_state(pg_pool, endpoint, table)
+        method, url, request_kwargs, prefix = self._request_spec(endpoint, state)
+        cursor_at = self._sync_started_at(endpoint)
+        
+        async with await self._request(session, method, url, timeout, **request_kwargs) as response:
+            if response.status == 304:
+                logger.info(f"⏭️ {endpoint} not modified upstream - skipped load")
+                return await self._skip_load(pg_pool, endpoint, cursor_at)
             response.raise_for_status()
-            launches = response.json()
-            
-            logger.info(f"Retrieved {len(launches)} launches from API")
             
-            # Load to PostgreSQL
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
             
-            inserted_count = 0
-            updated_count = 0
-            
-            for launch in launches:
-                cursor.execute("""
-                    INSERT INTO bronze.launches (id, data, extracted_at, source_system)
-                    VALUES (%s, %s, %s, %s)
-                    ON CONFLICT (id) 
-                    DO UPDATE SET 
-                        data = EXCLUDED.data,
-                        extracted_at = EXCLUDED.extracted_at
-                    RETURNING (xmax = 0) AS inserted
-                """, (
-                    launch['id'], 
-                    json.dumps(launch), 
-                    datetime.now(),
-                    'spacex_api_v4'
+            # Parse straight off the socket, hashing the raw body on the way through
+            body = _HashingReader(response.content)
+            jsonl, records_count = await self._spool_jsonl(body, prefix)
+        
+        with jsonl:
+            content_hash = None
+            if not (etag or last_modified):
+                # No validators to send next time - fall back to comparing body hashes
+                content_hash = body.hexdigest()
+                if content_hash == state.get('content_hash'):
+                    logger.info(f"⏭️ {endpoint} unchanged since last load - skipped load")
+                    return await self._skip_load(pg_pool, endpoint, cursor_at)
+            
+            if BRONZE_LANDING_URI:
+                # Landing may upload to object storage - keep it off the event loop
+                await asyncio.to_thread(self._land, endpoint, jsonl, records_count)
+            
+            sync = {'etag': etag, 'last_modified': last_modified, 'content_hash': content_hash, 'cursor_at': cursor_at}
+            return await self._copy_to_table(pg_pool, endpoint, table, jsonl, records_count, sync)
+    
+    async def _fetch_endpoints(self, endpoints: Dict[str, int]) -> Dict[str, int]:
+        """Fetch and load endpoints ({endpoint: timeout}) concurrently"""
+        async with asyncpg.create_pool(min_size=1, max_size=len(endpoints), **self.db_config) as pg_pool:
+            # Keep-alive pool shared by every request; aiohttp negotiates gzip/deflate (and br
+            # when a brotli decoder is installed) and decodes transparently
+            connector = aiohttp.TCPConnector(limit_per_host=len(endpoints))
+            async with aiohttp.ClientSession(connector=connector) as session:
+                counts = await asyncio.gather(*(
+                    self._fetch_to_table(session, pg_pool, endpoint, f'bronze.{endpoint}', timeout)
+                    for endpoint, timeout in endpoints.items()
                 ))
-                
-                is_inserted = cursor.fetchone()[0]
-                if is_inserted:
-                    inserted_count += 1
-                else:
-                    updated_count += 1
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+        return dict(zip(endpoints, counts))
+    
+    def extract_all(self, **context) -> Dict[str, int]:
+        """Extract launches, Starlink and rockets concurrently from one event loop"""
+        logger.info("🚀 Extracting launches, Starlink and rockets from SpaceX API...")
+        dag_id = context.get('dag').dag_id if context.get('dag') else 'manual'
+        
+        try:
+            counts = asyncio.run(self._fetch_endpoints(ENDPOINT_TIMEOUTS))
             
-            logger.info(f"✅ Launches loaded: {inserted_count} new, {updated_count} updated")
+            logger.info(f"✅ Bronze layer loaded: {counts}")
             
-            # Log success
-            self.log_pipeline_run(
-                context.get('dag').dag_id if context.get('dag') else 'manual',
-                'extract_launches',
-                'success',
-                len(launches)
-            )
+            # Log success per endpoint
+            for endpoint, records_count in counts.items():
+                self.log_pipeline_run(dag_id, f'extract_{endpoint}', 'success', records_count)
             
-            return len(launches)
+            return counts
             
         except Exception as e:
-            logger.error(f"❌ Error extracting launches: {e}")
+            logger.error(f"❌ Error extracting bronze data: {e}")
             # Log error
-            self.log_pipeline_run(
-                context.get('dag').dag_id if context.get('dag') else 'manual',
-                'extract_launches',
-                'failed',
-                0,
-                str(e)
-            )
+            self.log_pipeline_run(dag_id, 'extract_all_bronze', 'failed', 0, str(e))
             raise
     
-    def extract_starlink(self, **context) -> int:
-        """Extract Starlink satellite data from SpaceX API"""
-        logger.info("🛰️ Extracting Starlink satellites from SpaceX API...")
+    def _extract_endpoint(self, endpoint: str, **context) -> int:
+        """Extract a single endpoint through the same async fetch/COPY path as extract_all"""
+        dag_id = context.get('dag').dag_id if context.get('dag') else 'manual'
         
         try:
-            # Fetch data from API
-            response = requests.get(f"{self.base_url}/starlink", timeout=120)
-            response.raise_for_status()
-            satellites = response.json()
-            
-            logger.info(f"Retrieved {len(satellites)} satellites from API")
-            
-            # Load to PostgreSQL
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            inserted_count = 0
-            updated_count = 0
+            records_count = asyncio.run(self._fetch_endpoints({endpoint: ENDPOINT_TIMEOUTS[endpoint]}))[endpoint]
             
-            for satellite in satellites:
-                cursor.execute("""
-                    INSERT INTO bronze.starlink (id, data, extracted_at, source_system)
-                    VALUES (%s, %s, %s, %s)
-                    ON CONFLICT (id) 
-                    DO UPDATE SET 
-                        data = EXCLUDED.data,
-                        extracted_at = EXCLUDED.extracted_at
-                    RETURNING (xmax = 0) AS inserted
-                """, (
-                    satellite['id'], 
-                    json.dumps(satellite), 
-                    datetime.now(),
-                    'spacex_api_v4'
-                ))
-                
-                is_inserted = cursor.fetchone()[0]
-                if is_inserted:
-                    inserted_count += 1
-                else:
-                    updated_count += 1
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
-            
-            logger.info(f"✅ Starlink loaded: {inserted_count} new, {updated_count} updated")
+            logger.info(f"✅ {endpoint} loaded: {records_count} records")
             
             # Log success
-            self.log_pipeline_run(
-                context.get('dag').dag_id if context.get('dag') else 'manual',
-                'extract_starlink',
-                'success',
-                len(satellites)
-            )
+            self.log_pipeline_run(dag_id, f'extract_{endpoint}', 'success', records_count)
             
-            return len(satellites)
+            return records_count
             
         except Exception as e:
-            logger.error(f"❌ Error extracting Starlink data: {e}")
+            logger.error(f"❌ Error extracting {endpoint}: {e}")
             # Log error
-            self.log_pipeline_run(
-                context.get('dag').dag_id if context.get('dag') else 'manual',
-                'extract_starlink',
-                'failed',
-                0,
-                str(e)
-            )
+            self.log_pipeline_run(dag_id, f'extract_{endpoint}', 'failed', 0, str(e))
             raise
     
+    def extract_launches(self, **context) -> int:
+        """Extract launch data from SpaceX API and load to bronze.launches"""
+        logger.info("🚀 Extracting launches from SpaceX API...")
+        return self._extract_endpoint('launches', **context)
+    
+    def extract_starlink(self, **context) -> int:
+        """Extract Starlink satellite data from SpaceX API"""
+        logger.info("🛰️ Extracting Starlink satellites from SpaceX API...")
+        return self._extract_endpoint('starlink', **context)
+    
     def extract_rockets(self, **context) -> int:
         """Extract rocket data from SpaceX API"""
         logger.info("🚀 Extracting rockets from SpaceX API...")
-        
-        try:
-            # Fetch data from API
-            response = requests.get(f"{self.base_url}/rockets", timeout=30)
-            response.raise_for_status()
-            rockets = response.json()
-            
-            logger.info(f"Retrieved {len(rockets)} rockets from API")
-            
-            # Load to PostgreSQL
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            for rocket in rockets:
-                cursor.execute("""
-                    INSERT INTO bronze.rockets (id, data, extracted_at, source_system)
-                    VALUES (%s, %s, %s, %s)
-                    ON CONFLICT (id) 
-                    DO UPDATE SET 
-                        data = EXCLUDED.data,
-                        extracted_at = EXCLUDED.extracted_at
-                """, (
-                    rocket['id'], 
-                    json.dumps(rocket), 
-                    datetime.now(),
-                    'spacex_api_v4'
-                ))
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
-            
-            logger.info(f"✅ Rockets loaded: {len(rockets)} records")
-            
-            # Log success
-            self.log_pipeline_run(
-                context.get('dag').dag_id if context.get('dag') else 'manual',
-                'extract_rockets',
-                'success',
-                len(rockets)
-            )
-            
-            return len(rockets)
-            
-        except Exception as e:
-            logger.error(f"❌ Error extracting rockets: {e}")
-            # Log error
-            self.log_pipeline_run(
-                context.get('dag').dag_id if context.get('dag') else 'manual',
-                'extract_rockets',
-                'failed',
-                0,
-                str(e)
-            )
-            raise
+        return self._extract_endpoint('rockets', **context)
     
     def get_extraction_summary(self) -> Dict:
-        """Get summary of extracted data"""
+        """Get summary of extracted data
+        
+        Row counts are the planner's live-tuple estimates from pg_stat_user_tables,
+        so they are approximate but cost no table scans.
+        """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # Get counts from bronze tables
-            cursor.execute("""
-                SELECT 
-                    (SELECT COUNT(*) FROM bronze.launches) as launches_count,
-                    (SELECT COUNT(*) FROM bronze.starlink) as starlink_count,
-                    (SELECT COUNT(*) FROM bronze.rockets) as rockets_count,
-                    (SELECT MAX(extracted_at) FROM bronze.launches) as last_launch_update,
-                    (SELECT MAX(extracted_at) FROM bronze.starlink) as last_starlink_update
-            """)
-            
-            result = cursor.fetchone()
-            cursor.close()
-            conn.close()
+            with self._conn() as conn:
+                with conn:
+                    with conn.cursor() as cursor:
+                        # Counts from table stats, last updates from the extracted_at indexes
+                        cursor.execute("""
+                            WITH stats AS (
+                                SELECT relname, n_live_tup
+                                FROM pg_stat_user_tables
+                                WHERE schemaname = 'bronze'
+                                  AND relname IN ('launches', 'starlink', 'rockets')
+                            )
+                            SELECT 
+                                (SELECT n_live_tup FROM stats WHERE relname = 'launches') as launches_count,
+                                (SELECT n_live_tup FROM stats WHERE relname = 'starlink') as starlink_count,
+                                (SELECT n_live_tup FROM stats WHERE relname = 'rockets') as rockets_count,
+                                (SELECT MAX(extracted_at) FROM bronze.launches) as last_launch_update,
+                                (SELECT MAX(extracted_at) FROM bronze.starlink) as last_starlink_update
+                        """)
+                        
+                        result = cursor.fetchone()
             
             return {
                 'launches_count': result[0],
@@ -285,12 +463,11 @@ def test_connection() -> bool:
     """Test database connectivity"""
     try:
         extractor = SpaceXExtractor()
-        conn = extractor.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1")
-        result = cursor.fetchone()
-        cursor.close()
-        conn.close()
+        with extractor._conn() as conn:
+            with conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                    result = cursor.fetchone()
         
         logger.info("✅ Database connection test successful")
         return True
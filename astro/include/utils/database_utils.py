@@ -28,40 +28,39 @@ def check_data_quality(**context) -> Dict:
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Data quality checks
-        checks = {}
-        
-        # Check for duplicate launches
-        cursor.execute("SELECT COUNT(*), COUNT(DISTINCT id) FROM bronze.launches")
-        total, unique = cursor.fetchone()
-        checks['launches_duplicates'] = total - unique
-        
-        # Check for launches with missing data
-        cursor.execute("""
-            SELECT COUNT(*) FROM bronze.launches 
-            WHERE data->>'name' IS NULL OR data->>'date_utc' IS NULL
-        """)
-        checks['launches_missing_data'] = cursor.fetchone()[0]
-        
-        # Check Starlink satellites with active status
+        # All data quality checks in one round-trip - one pass per bronze table,
+        # filtering on generated columns instead of re-walking the JSONB
         cursor.execute("""
+            WITH launch_checks AS (
+                SELECT 
+                    COUNT(*) - COUNT(DISTINCT id) as duplicates,
+                    COUNT(*) FILTER (WHERE name IS NULL OR date_utc IS NULL) as missing_data,
+                    COUNT(*) FILTER (WHERE extracted_at >= NOW() - INTERVAL '7 days') as recent
+                FROM bronze.launches
+            ),
+            starlink_checks AS (
+                SELECT 
+                    COUNT(*) as total,
+                    COUNT(*) FILTER (WHERE NOT decayed) as active,
+                    COUNT(*) FILTER (WHERE decayed) as inactive
+                FROM bronze.starlink
+            )
             SELECT 
-                COUNT(*) as total,
-                COUNT(CASE WHEN data->'spaceTrack'->>'DECAYED' = '0' THEN 1 END) as active,
-                COUNT(CASE WHEN data->'spaceTrack'->>'DECAYED' = '1' THEN 1 END) as inactive
-            FROM bronze.starlink
+                l.duplicates, l.missing_data, l.recent,
+                s.total, s.active, s.inactive
+            FROM launch_checks l
+            CROSS JOIN starlink_checks s
         """)
-        total, active, inactive = cursor.fetchone()
-        checks['starlink_total'] = total
-        checks['starlink_active'] = active
-        checks['starlink_inactive'] = inactive
+        row = cursor.fetchone()
         
-        # Check recent data freshness (last 7 days)
-        cursor.execute("""
-            SELECT COUNT(*) FROM bronze.launches 
-            WHERE extracted_at >= NOW() - INTERVAL '7 days'
-        """)
-        checks['recent_launches'] = cursor.fetchone()[0]
+        checks = {
+            'launches_duplicates': row[0],
+            'launches_missing_data': row[1],
+            'recent_launches': row[2],
+            'starlink_total': row[3],
+            'starlink_active': row[4],
+            'starlink_inactive': row[5]
+        }
         
         cursor.close()
         conn.close()
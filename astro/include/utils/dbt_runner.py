@@ -0,0 +1,109 @@
+"""
+In-process dbt runner for SpaceX ETL pipeline
+Calls dbt-core's Python API instead of shelling out, parsing the project once per worker process
+Every invocation writes to its own target dir, so parallel model tasks never clobber each other's
+artifacts; finished top-level artifacts are published atomically to the shared target/ dir
+"""
+
+import os
+import json
+import shutil
+import logging
+import tempfile
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+DBT_PROJECT_DIR = os.getenv('SPACEX_DBT_PROJECT_DIR', '/usr/local/airflow/include/dbt')
+DBT_TARGET_DIR = os.path.join(DBT_PROJECT_DIR, 'target')
+DBT_MANIFEST_PATH = os.path.join(DBT_TARGET_DIR, 'manifest.json')
+
+# dbtRunner bound to the parsed manifest - created on first use, reused by later invocations
+_RUNNER = None
+
+def _project_args() -> List[str]:
+    """Project and profiles location appended to every dbt command"""
+    return ['--project-dir', DBT_PROJECT_DIR, '--profiles-dir', DBT_PROJECT_DIR]
+
+def _publish_artifacts(target_path: str) -> None:
+    """Copy top-level artifacts (manifest, run results, docs) into DBT_TARGET_DIR
+    
+    Each file is staged under a temporary name and swapped in with os.replace, so readers
+    such as the scheduler parsing the DAG only ever see a complete file.
+    """
+    os.makedirs(DBT_TARGET_DIR, exist_ok=True)
+    for name in os.listdir(target_path):
+        source = os.path.join(target_path, name)
+        if not os.path.isfile(source):
+            continue
+        staged = os.path.join(DBT_TARGET_DIR, f'.{name}.{os.getpid()}.tmp')
+        shutil.copyfile(source, staged)
+        os.replace(staged, os.path.join(DBT_TARGET_DIR, name))
+
+def _get_runner():
+    """Return a dbtRunner that reuses one parsed manifest for this process"""
+    global _RUNNER
+    if _RUNNER is None:
+        # Imported lazily - dbt is heavy and only needed at task runtime
+        from dbt.cli.main import dbtRunner
+        
+        with tempfile.TemporaryDirectory(prefix='dbt-parse-') as target_path:
+            # Seed partial parsing from the last published parse so this one stays cheap
+            partial_parse = os.path.join(DBT_TARGET_DIR, 'partial_parse.msgpack')
+            if os.path.exists(partial_parse):
+                shutil.copyfile(partial_parse, os.path.join(target_path, 'partial_parse.msgpack'))
+            
+            result = dbtRunner().invoke(['parse'] + _project_args() + ['--target-path', target_path])
+            if not result.success:
+                raise Exception(f"dbt parse failed: {result.exception}")
+            _publish_artifacts(target_path)
+        
+        _RUNNER = dbtRunner(manifest=result.result)
+    return _RUNNER
+
+def run_dbt(args: List[str]) -> None:
+    """Invoke a dbt command in-process, raising if it does not succeed"""
+    command = ' '.join(args)
+    logger.info(f"🔧 Running dbt {command}...")
+    
+    runner = _get_runner()
+    with tempfile.TemporaryDirectory(prefix='dbt-target-') as target_path:
+        result = runner.invoke(args + _project_args() + ['--target-path', target_path])
+        if not result.success:
+            raise Exception(f"dbt {command} failed: {result.exception or result.result}")
+        _publish_artifacts(target_path)
+    
+    logger.info(f"✅ dbt {command} completed")
+
+def load_model_graph(manifest_path: str = DBT_MANIFEST_PATH) -> Dict[str, Dict]:
+    """Read the project's models and their model-to-model dependencies from a dbt manifest
+    
+    Returns {unique_id: {'name', 'layer', 'depends_on'}} where layer is the models/ subfolder
+    (silver/gold), or None for a model at the top of models/. Returns {} when the manifest is
+    missing or unreadable, so the DAG falls back to one task per layer instead of failing to import.
+    """
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        
+        project_name = manifest['metadata'].get('project_name')
+        models = {
+            unique_id: node
+            for unique_id, node in manifest['nodes'].items()
+            if node['resource_type'] == 'model' and node['package_name'] == project_name
+        }
+        
+        return {
+            unique_id: {
+                'name': node['name'],
+                'layer': node['fqn'][1] if len(node['fqn']) > 2 else None,
+                'depends_on': [upstream for upstream in node['depends_on']['nodes'] if upstream in models]
+            }
+            for unique_id, node in models.items()
+        }
+    except FileNotFoundError:
+        logger.warning(f"dbt manifest not found at {manifest_path}")
+        return {}
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"dbt manifest at {manifest_path} is unreadable: {e}")
+        return {}
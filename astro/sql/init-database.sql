@@ -43,7 +43,10 @@ CREATE TABLE IF NOT EXISTS bronze.launches (
     data JSONB NOT NULL,
     extracted_at TIMESTAMP DEFAULT NOW(),
     source_system VARCHAR DEFAULT 'spacex_api_v4',
-    created_at TIMESTAMP DEFAULT NOW()
+    created_at TIMESTAMP DEFAULT NOW(),
+    -- Parsed once on write instead of per query (kept as text: a timestamptz cast is not immutable)
+    name TEXT GENERATED ALWAYS AS (data->>'name') STORED,
+    date_utc TEXT GENERATED ALWAYS AS (data->>'date_utc') STORED
 );
 
 CREATE TABLE IF NOT EXISTS bronze.starlink (
@@ -51,7 +54,14 @@ CREATE TABLE IF NOT EXISTS bronze.starlink (
     data JSONB NOT NULL,
     extracted_at TIMESTAMP DEFAULT NOW(),
     source_system VARCHAR DEFAULT 'spacex_api_v4',
-    created_at TIMESTAMP DEFAULT NOW()
+    created_at TIMESTAMP DEFAULT NOW(),
+    -- Parsed once on write; NULL when spaceTrack carries no recognisable DECAYED flag
+    decayed BOOLEAN GENERATED ALWAYS AS (
+        CASE
+            WHEN data->'spaceTrack'->>'DECAYED' IN ('1', 'true', 'True') THEN true
+            WHEN data->'spaceTrack'->>'DECAYED' IN ('0', 'false', 'False') THEN false
+        END
+    ) STORED
 );
 
 CREATE TABLE IF NOT EXISTS bronze.rockets (
@@ -67,12 +77,15 @@ CREATE INDEX IF NOT EXISTS idx_launches_extracted_at ON bronze.launches(extracte
 CREATE INDEX IF NOT EXISTS idx_starlink_extracted_at ON bronze.starlink(extracted_at);
 CREATE INDEX IF NOT EXISTS idx_rockets_extracted_at ON bronze.rockets(extracted_at);
 
+-- Indexes on the generated columns used by data quality checks
+CREATE INDEX IF NOT EXISTS idx_launches_name ON bronze.launches (name);
+CREATE INDEX IF NOT EXISTS idx_launches_date_utc ON bronze.launches (date_utc);
+CREATE INDEX IF NOT EXISTS idx_starlink_decayed ON bronze.starlink (decayed);
+
 -- JSON indexes for faster queries
-CREATE INDEX IF NOT EXISTS idx_launches_name ON bronze.launches USING GIN ((data->>'name'));
+-- Text-valued paths (->>) use B-tree expression indexes; GIN has no default operator class for text
 CREATE INDEX IF NOT EXISTS idx_launches_success ON bronze.launches USING GIN ((data->'success'));
-CREATE INDEX IF NOT EXISTS idx_launches_date ON bronze.launches USING GIN ((data->>'date_utc'));
-CREATE INDEX IF NOT EXISTS idx_starlink_decayed ON bronze.starlink USING GIN ((data->'spaceTrack'->>'DECAYED'));
-CREATE INDEX IF NOT EXISTS idx_starlink_launch ON bronze.starlink USING GIN ((data->>'launch'));
+CREATE INDEX IF NOT EXISTS idx_starlink_launch ON bronze.starlink ((data->>'launch'));
 
 -- Create a metadata table to track pipeline runs
 CREATE TABLE IF NOT EXISTS bronze.pipeline_metadata (
@@ -85,11 +98,24 @@ CREATE TABLE IF NOT EXISTS bronze.pipeline_metadata (
     created_at TIMESTAMP DEFAULT NOW()
 );
 
+-- Per-endpoint HTTP validators so unchanged API responses skip the bronze load,
+-- plus the cursor (UTC) incremental endpoints query from
+CREATE TABLE IF NOT EXISTS bronze.sync_state (
+    endpoint VARCHAR PRIMARY KEY,
+    etag VARCHAR,
+    last_modified VARCHAR,
+    content_hash VARCHAR,
+    cursor_at TIMESTAMP,
+    records_synced INTEGER DEFAULT 0,
+    synced_at TIMESTAMP DEFAULT NOW()
+);
+
 -- Grant ownership of all tables to spacex_user
 ALTER TABLE bronze.launches OWNER TO spacex_user;
 ALTER TABLE bronze.starlink OWNER TO spacex_user;
 ALTER TABLE bronze.rockets OWNER TO spacex_user;
 ALTER TABLE bronze.pipeline_metadata OWNER TO spacex_user;
+ALTER TABLE bronze.sync_state OWNER TO spacex_user;
 
 -- Insert initial metadata record
 INSERT INTO bronze.pipeline_metadata (pipeline_name, status, records_processed)
@@ -111,7 +137,7 @@ BEGIN
     
     SELECT 
         'bronze_tables'::TEXT,
-        CASE WHEN COUNT(*) = 4 THEN 'OK' ELSE 'ERROR' END::TEXT,
+        CASE WHEN COUNT(*) = 5 THEN 'OK' ELSE 'ERROR' END::TEXT,
         'Found ' || COUNT(*)::TEXT || ' tables in bronze schema'::TEXT
     FROM information_schema.tables 
     WHERE table_schema = 'bronze'
@@ -131,5 +157,5 @@ SELECT * FROM verify_setup();
 -- Log successful initialization
 \echo 'SpaceX ETL Database initialized successfully!'
 \echo 'Schemas created: bronze, silver, gold'
-\echo 'Tables created: launches, starlink, rockets, pipeline_metadata'
+\echo 'Tables created: launches, starlink, rockets, pipeline_metadata, sync_state'
 \echo 'Ready for SpaceX API data ingestion!'
\ No newline at end of file
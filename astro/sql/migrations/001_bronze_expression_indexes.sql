@@ -0,0 +1,16 @@
+-- Migration 001: B-tree expression indexes on the JSONB paths used by data quality checks
+-- init-database.sql only runs on a fresh volume; apply this to an existing database with:
+--   docker exec -i spacex_postgres psql -U spacex_user -d spacex_db < sql/migrations/001_bronze_expression_indexes.sql
+-- CONCURRENTLY avoids blocking extract writes but cannot run inside a transaction block,
+-- so run this file with psql's default autocommit (no --single-transaction).
+
+-- Launch name / date presence checks
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_launches_name ON bronze.launches ((data->>'name'));
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_launches_date_utc ON bronze.launches ((data->>'date_utc'));
+
+-- Starlink active/decayed split
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_starlink_decayed ON bronze.starlink ((data->'spaceTrack'->>'DECAYED'));
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_starlink_launch ON bronze.starlink ((data->>'launch'));
+
+-- Freshness window and MAX(extracted_at) need nothing new: init-database.sql already creates
+-- the idx_*_extracted_at B-tree indexes (scanned backwards, so no DESC variant is needed)
@@ -0,0 +1,14 @@
+-- Migration 002: per-endpoint sync state for conditional GET / unchanged-body detection
+-- Apply to an existing database with:
+--   docker exec -i spacex_postgres psql -U spacex_user -d spacex_db < sql/migrations/002_bronze_sync_state.sql
+
+CREATE TABLE IF NOT EXISTS bronze.sync_state (
+    endpoint VARCHAR PRIMARY KEY,
+    etag VARCHAR,
+    last_modified VARCHAR,
+    content_hash VARCHAR,
+    records_synced INTEGER DEFAULT 0,
+    synced_at TIMESTAMP DEFAULT NOW()
+);
+
+ALTER TABLE bronze.sync_state OWNER TO spacex_user;
@@ -0,0 +1,25 @@
+-- Migration 003: materialize the JSONB fields used by data quality checks as generated columns
+-- Apply to an existing database with:
+--   docker exec -i spacex_postgres psql -U spacex_user -d spacex_db < sql/migrations/003_bronze_generated_columns.sql
+-- Adding a STORED generated column rewrites the table once; later writes compute the values on insert.
+
+ALTER TABLE bronze.launches
+    ADD COLUMN IF NOT EXISTS name TEXT GENERATED ALWAYS AS (data->>'name') STORED,
+    ADD COLUMN IF NOT EXISTS date_utc TEXT GENERATED ALWAYS AS (data->>'date_utc') STORED;
+
+ALTER TABLE bronze.starlink
+    ADD COLUMN IF NOT EXISTS decayed BOOLEAN GENERATED ALWAYS AS (
+        CASE
+            WHEN data->'spaceTrack'->>'DECAYED' IN ('1', 'true', 'True') THEN true
+            WHEN data->'spaceTrack'->>'DECAYED' IN ('0', 'false', 'False') THEN false
+        END
+    ) STORED;
+
+-- Swap the migration 001 expression indexes for plain indexes on the new columns
+DROP INDEX CONCURRENTLY IF EXISTS bronze.idx_launches_name;
+DROP INDEX CONCURRENTLY IF EXISTS bronze.idx_launches_date_utc;
+DROP INDEX CONCURRENTLY IF EXISTS bronze.idx_starlink_decayed;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_launches_name ON bronze.launches (name);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_launches_date_utc ON bronze.launches (date_utc);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_starlink_decayed ON bronze.starlink (decayed);
@@ -0,0 +1,6 @@
+-- Migration 004: sync cursor for incremental /query extracts
+-- Apply to an existing database with:
+--   docker exec -i spacex_postgres psql -U spacex_user -d spacex_db < sql/migrations/004_bronze_sync_cursor.sql
+-- Until an endpoint records a cursor the extractor falls back to MAX(extracted_at) of its bronze table.
+
+ALTER TABLE bronze.sync_state ADD COLUMN IF NOT EXISTS cursor_at TIMESTAMP;
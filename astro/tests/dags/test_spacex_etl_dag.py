@@ -0,0 +1,56 @@
+"""Shape tests for the SpaceX ETL DAG's dbt model tasks, built from a stubbed model graph instead of a dbt manifest."""
+
+import importlib.util
+import os
+
+import pytest
+
+from include.utils import dbt_runner
+
+DAG_FILE = os.path.join(os.path.dirname(__file__), '..', '..', 'dags', 'spacex_etl_dag.py')
+
+SILVER_ONLY = {
+    'model.spacex_analytics.silver_launches': {
+        'name': 'silver_launches', 'layer': 'silver', 'depends_on': []
+    },
+    'model.spacex_analytics.silver_starlink': {
+        'name': 'silver_starlink', 'layer': 'silver',
+        'depends_on': ['model.spacex_analytics.silver_launches']
+    }
+}
+
+
+def load_dag(monkeypatch, model_graph):
+    """Import the DAG file with load_model_graph returning the given graph"""
+    monkeypatch.setattr(dbt_runner, 'load_model_graph', lambda *args: model_graph)
+    spec = importlib.util.spec_from_file_location('spacex_etl_dag_under_test', DAG_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.dag
+
+
+@pytest.mark.parametrize('model_graph', [SILVER_ONLY, {}], ids=['silver_only_manifest', 'no_manifest'])
+def test_every_task_is_wired_between_preflight_and_final_validation(monkeypatch, model_graph):
+    dag = load_dag(monkeypatch, model_graph)
+
+    for task in dag.tasks:
+        if task.task_id != 'test_database_connection':
+            assert task.upstream_task_ids, f"{task.task_id} has no upstream task"
+        if task.task_id != 'final_validation':
+            assert task.downstream_task_ids, f"{task.task_id} has no downstream task"
+
+
+def test_manifest_without_gold_models_has_no_layer_fallback(monkeypatch):
+    dag = load_dag(monkeypatch, SILVER_ONLY)
+
+    model_task_ids = {task_id for task_id in dag.task_ids if '_models.' in task_id}
+    assert model_task_ids == {'silver_models.run_silver_launches', 'silver_models.run_silver_starlink'}
+    assert dag.get_task('silver_models.run_silver_starlink').upstream_task_ids == {
+        'silver_models.run_silver_launches'
+    }
+
+
+def test_no_manifest_runs_layers_in_order(monkeypatch):
+    dag = load_dag(monkeypatch, {})
+
+    assert dag.get_task('gold_models.run_gold').upstream_task_ids == {'silver_models.run_silver'}
@@ -0,0 +1,136 @@
+"""Unit tests for the SpaceX extractor helpers (request building, sync state, JSONL spooling and landing). No API or database is needed."""
+
+import asyncio
+import gzip
+import io
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+from include.extractors import spacex_extractor
+from include.extractors.spacex_extractor import (
+    COPY_DELIMITER, COPY_QUOTE, INCREMENTAL_LOOKBACK, SpaceXExtractor
+)
+
+
+@pytest.fixture
+def extractor():
+    return SpaceXExtractor()
+
+
+class FakePool:
+    """Stand-in for an asyncpg pool whose connections return a single row"""
+
+    def __init__(self, row):
+        self.conn = mock.AsyncMock()
+        self.conn.fetchrow.return_value = row
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+class AsyncBody:
+    """Async file-like body fed to ijson, like aiohttp's response stream"""
+
+    def __init__(self, payload):
+        self._buffer = io.BytesIO(json.dumps(payload).encode())
+
+    async def read(self, size=-1):
+        return self._buffer.read(size)
+
+
+def test_request_spec_full_fetch_sends_validators(extractor):
+    state = {'etag': '"abc"', 'last_modified': 'Tue, 01 Oct 2024 00:00:00 GMT', 'cursor_at': None}
+
+    method, url, kwargs, prefix = extractor._request_spec('launches', state)
+
+    assert (method, url, prefix) == ('GET', f"{extractor.base_url}/launches", 'item')
+    assert kwargs['headers'] == {
+        'If-None-Match': '"abc"',
+        'If-Modified-Since': 'Tue, 01 Oct 2024 00:00:00 GMT'
+    }
+
+
+def test_request_spec_incremental_queries_since_cursor(extractor):
+    cursor_at = datetime(2024, 10, 1, 12, 0, 0)
+
+    method, url, kwargs, prefix = extractor._request_spec('starlink', {'cursor_at': cursor_at})
+
+    assert (method, url, prefix) == ('POST', f"{extractor.base_url}/starlink/query", 'docs.item')
+    assert kwargs['json'] == {
+        'query': {'spaceTrack.CREATION_DATE': {'$gte': (cursor_at - INCREMENTAL_LOOKBACK).isoformat()}},
+        'options': {'pagination': False}
+    }
+
+
+def test_request_spec_ignores_cursor_for_non_incremental_endpoint(extractor):
+    method, url, kwargs, prefix = extractor._request_spec('rockets', {'cursor_at': datetime(2024, 10, 1)})
+
+    assert (method, url, kwargs, prefix) == ('GET', f"{extractor.base_url}/rockets", {'headers': {}}, 'item')
+
+
+def test_get_sync_state_prefers_stored_cursor(extractor):
+    cursor_at = datetime(2024, 10, 1)
+    pool = FakePool(('"abc"', None, None, cursor_at, datetime(2024, 9, 1)))
+
+    state = asyncio.run(extractor._get_sync_state(pool, 'launches', 'bronze.launches'))
+
+    assert state == {'etag': '"abc"', 'last_modified': None, 'content_hash': None, 'cursor_at': cursor_at}
+
+
+def test_get_sync_state_falls_back_to_last_extracted_at(extractor):
+    last_extracted_at = datetime(2024, 9, 1)
+    pool = FakePool((None, None, None, None, last_extracted_at))
+
+    state = asyncio.run(extractor._get_sync_state(pool, 'starlink', 'bronze.starlink'))
+
+    assert state['cursor_at'] == last_extracted_at
+    assert pool.conn.fetchrow.call_args.args[1:] == ('starlink',)
+
+
+def test_get_sync_state_empty_table_has_no_cursor(extractor):
+    pool = FakePool((None, None, None, None, None))
+
+    assert asyncio.run(extractor._get_sync_state(pool, 'starlink', 'bronze.starlink'))['cursor_at'] is None
+
+
+# Characters that would break naive CSV/text COPY framing
+TRICKY_RECORDS = [
+    {'id': '1', 'name': 'line\nbreak, "quoted" \\ backslash', 'ctrl': '\x01\x02', 'mass_kg': 260.5},
+    {'id': '2', 'name': None, 'tags': ['a', 'b'], 'nested': {'k': 1}}
+]
+
+
+def test_spool_jsonl_writes_one_copy_safe_line_per_record(extractor):
+    spool, count = asyncio.run(extractor._spool_jsonl(AsyncBody(TRICKY_RECORDS), 'item'))
+    data = spool.read()
+
+    assert count == 2
+    # The COPY quote/delimiter bytes must never appear raw in the data
+    assert COPY_QUOTE.encode() not in data and COPY_DELIMITER.encode() not in data
+    assert [json.loads(line) for line in data.splitlines()] == TRICKY_RECORDS
+
+
+def test_spool_jsonl_reads_query_docs(extractor):
+    body = AsyncBody({'docs': TRICKY_RECORDS, 'totalDocs': 2})
+
+    spool, count = asyncio.run(extractor._spool_jsonl(body, 'docs.item'))
+
+    assert count == 2
+    assert [json.loads(line)['id'] for line in spool.read().splitlines()] == ['1', '2']
+
+
+def test_land_writes_gzipped_copy_and_rewinds(extractor, tmp_path, monkeypatch):
+    monkeypatch.setattr(spacex_extractor, 'BRONZE_LANDING_URI', str(tmp_path))
+    spool, count = asyncio.run(extractor._spool_jsonl(AsyncBody(TRICKY_RECORDS), 'item'))
+    spool.read()
+
+    uri = extractor._land('starlink', spool, count)
+
+    assert uri.startswith(f"{tmp_path}/starlink/") and uri.endswith('.jsonl.gz')
+    with gzip.open(uri) as landed:
+        assert landed.read() == spool.read()
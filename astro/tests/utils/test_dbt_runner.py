@@ -0,0 +1,132 @@
+"""Unit tests for the dbt runner helpers that shape the DAG and isolate parallel dbt invocations. dbt itself is not needed."""
+
+import json
+import os
+
+import pytest
+
+from include.utils import dbt_runner
+from include.utils.dbt_runner import load_model_graph, run_dbt
+
+
+def model_node(name, fqn, depends_on=(), package='spacex_analytics', resource_type='model'):
+    return {
+        'resource_type': resource_type,
+        'package_name': package,
+        'name': name,
+        'fqn': fqn,
+        'depends_on': {'nodes': list(depends_on)}
+    }
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    manifest = {
+        'metadata': {'project_name': 'spacex_analytics'},
+        'nodes': {
+            'model.spacex_analytics.silver_launches': model_node(
+                'silver_launches', ['spacex_analytics', 'silver', 'silver_launches'],
+                ['source.spacex_analytics.bronze.launches']
+            ),
+            'model.spacex_analytics.silver_starlink': model_node(
+                'silver_starlink', ['spacex_analytics', 'silver', 'silver_starlink'],
+                ['source.spacex_analytics.bronze.starlink']
+            ),
+            'model.spacex_analytics.starlink_42k_projection': model_node(
+                'starlink_42k_projection', ['spacex_analytics', 'gold', 'starlink_42k_projection'],
+                ['model.spacex_analytics.silver_starlink', 'model.spacex_analytics.silver_launches',
+                 'model.dbt_utils.helper']
+            ),
+            'model.spacex_analytics.calendar': model_node('calendar', ['spacex_analytics', 'calendar']),
+            'model.dbt_utils.helper': model_node('helper', ['dbt_utils', 'helper'], package='dbt_utils'),
+            'test.spacex_analytics.not_null_id': model_node(
+                'not_null_id', ['spacex_analytics', 'not_null_id'],
+                ['model.spacex_analytics.silver_launches'], resource_type='test'
+            )
+        }
+    }
+    path = tmp_path / 'manifest.json'
+    path.write_text(json.dumps(manifest))
+    return str(path)
+
+
+def test_load_model_graph_keeps_only_project_models(manifest_path):
+    graph = load_model_graph(manifest_path)
+
+    assert set(graph) == {
+        'model.spacex_analytics.silver_launches',
+        'model.spacex_analytics.silver_starlink',
+        'model.spacex_analytics.starlink_42k_projection',
+        'model.spacex_analytics.calendar'
+    }
+
+
+def test_load_model_graph_edges_are_model_to_model(manifest_path):
+    graph = load_model_graph(manifest_path)
+
+    # Sources and other packages' models are not task dependencies
+    assert graph['model.spacex_analytics.silver_launches']['depends_on'] == []
+    assert graph['model.spacex_analytics.starlink_42k_projection']['depends_on'] == [
+        'model.spacex_analytics.silver_starlink',
+        'model.spacex_analytics.silver_launches'
+    ]
+
+
+def test_load_model_graph_layer_is_models_subfolder(manifest_path):
+    graph = load_model_graph(manifest_path)
+
+    assert graph['model.spacex_analytics.silver_starlink']['layer'] == 'silver'
+    assert graph['model.spacex_analytics.starlink_42k_projection']['layer'] == 'gold'
+    assert graph['model.spacex_analytics.calendar']['layer'] is None
+
+
+def test_load_model_graph_missing_manifest_falls_back(tmp_path):
+    assert load_model_graph(str(tmp_path / 'manifest.json')) == {}
+
+
+def test_load_model_graph_partial_manifest_falls_back(tmp_path, manifest_path):
+    # e.g. read while another process is still writing it
+    with open(manifest_path) as f:
+        truncated = f.read()[:200]
+    path = tmp_path / 'truncated.json'
+    path.write_text(truncated)
+
+    assert load_model_graph(str(path)) == {}
+
+
+class FakeResult:
+    success = True
+    exception = None
+    result = None
+
+
+class FakeRunner:
+    """Records each invocation and writes artifacts to its --target-path like dbt does"""
+
+    def __init__(self):
+        self.target_paths = []
+
+    def invoke(self, args):
+        target_path = args[args.index('--target-path') + 1]
+        self.target_paths.append(target_path)
+        os.makedirs(os.path.join(target_path, 'compiled'))
+        with open(os.path.join(target_path, 'run_results.json'), 'w') as f:
+            json.dump({'args': args[:3]}, f)
+        return FakeResult()
+
+
+def test_run_dbt_isolates_target_path_and_publishes_artifacts(tmp_path, monkeypatch):
+    runner = FakeRunner()
+    monkeypatch.setattr(dbt_runner, '_RUNNER', runner)
+    monkeypatch.setattr(dbt_runner, 'DBT_TARGET_DIR', str(tmp_path / 'target'))
+
+    run_dbt(['run', '--select', 'silver_launches'])
+    run_dbt(['run', '--select', 'silver_starlink'])
+
+    first, second = runner.target_paths
+    assert first != second
+    assert not os.path.exists(first) and not os.path.exists(second)
+    # Last invocation's top-level artifacts win; directories and staging files are not published
+    assert sorted(os.listdir(tmp_path / 'target')) == ['run_results.json']
+    with open(tmp_path / 'target' / 'run_results.json') as f:
+        assert json.load(f) == {'args': ['run', '--select', 'silver_starlink']}